@@ -4,8 +4,6 @@ import pandas as pd
 import matplotlib.pyplot as plt
 from datetime import date, datetime
 from helper import get_bond_info, get_repo_info, get_bond_series, process_df
-import sys
-sys.path.append('../fincomepy')
 from fincomepy import Bond, Repo, BondFuture, ZspreadPar, ZspreadZero, CDS
 ## TO DO: future work: add download to result table and figure
 
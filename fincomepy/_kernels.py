@@ -0,0 +1,148 @@
+'''
+Numerical kernels used by Bond.
+
+The scalar kernels (dirty price, its derivative with respect to yield, and convexity) are compiled
+ahead of time into the fincomepy.bond_kernels extension when the package is built, so short-lived
+scripts do not pay the JIT compilation cost on first use. If the extension is not available, the
+same functions are JIT-compiled with Numba (and cached on disk) instead.
+
+This module only depends on Numba, so setup.py can load it without importing the package. To 
+build the extension in place, run:
+
+    python setup.py build_ext --inplace
+'''
+
+import functools
+
+import numpy as np
+from numba import njit, prange, guvectorize
+
+
+def _dirty_price(first_period, nperiod, rate, yld, redemption, frequency):
+    '''Dirty price (in percent) of a bond given its first (fractional) period and number of periods.'''
+    base = 1.0 + yld * 0.01 / frequency
+    if base <= 0.0:
+        # the price is undefined at yields of -100 * frequency percent or below, which a Newton 
+        # step can overshoot to; NaN lets the solvers treat it as a failed step instead of raising
+        return np.nan
+    discount = 1.0 / base
+    coupon_regular = rate * 0.01 / frequency
+    # the periods are first_period, first_period + 1, ..., so each discount factor is the
+    # previous one times 1 / base
+    DF = base ** -first_period
+    total = 0.0
+    for i in range(nperiod - 1):
+        total += coupon_regular * DF
+        DF *= discount
+    total += (coupon_regular + redemption * 0.01) * DF
+    return total * 100
+
+
+def _dirty_price_slope(first_period, nperiod, rate, yld, redemption, frequency):
+    '''Derivative of the dirty price with respect to yield, both in percent.'''
+    base = 1.0 + yld * 0.01 / frequency
+    if base <= 0.0:
+        return np.nan
+    discount = 1.0 / base
+    coupon_regular = rate * 0.01 / frequency
+    DF = base ** -first_period
+    total = 0.0
+    for i in range(nperiod - 1):
+        total += (first_period + i) * coupon_regular * DF
+        DF *= discount
+    total += (first_period + nperiod - 1) * (coupon_regular + redemption * 0.01) * DF
+    return -total / base / frequency
+
+
+def _convexity(first_period, nperiod, rate, yld, redemption, frequency, dirty_price_regular):
+    '''Convexity of a bond, accumulating sum(CF * DF * p) and sum(CF * DF * p^2) in a single pass.'''
+    base = 1.0 + yld * 0.01 / frequency
+    discount = 1.0 / base
+    coupon_regular = rate * 0.01 / frequency
+    DF = base ** -first_period
+    total_p = 0.0
+    total_p_2 = 0.0
+    for i in range(nperiod - 1):
+        CF_PV = coupon_regular * DF
+        period = first_period + i
+        total_p += CF_PV * period
+        total_p_2 += CF_PV * period * period
+        DF *= discount
+    CF_PV = (coupon_regular + redemption * 0.01) * DF
+    period = first_period + nperiod - 1
+    total_p += CF_PV * period
+    total_p_2 += CF_PV * period * period
+    return (total_p + total_p_2) / dirty_price_regular / (4 * base ** 2)
+
+
+_dirty_price_jit = njit(cache=True, fastmath=True)(_dirty_price)
+_dirty_price_slope_jit = njit(cache=True, fastmath=True)(_dirty_price_slope)
+_convexity_jit = njit(cache=True, fastmath=True)(_convexity)
+
+
+@njit(cache=True, parallel=True)
+def _yld_batch_kernel(first_period, nperiod, rate, dirty_price_target, redemption, frequency, maxiter, 
+                      yld_lower, yld_upper, out):
+    '''
+    Solve the yields (in percent) of a batch of bonds with Newton's method, one bond per thread. 
+    Bonds whose yield lies outside [yld_lower, yld_upper] and which Newton's method does not solve 
+    within maxiter steps get NaN.
+    '''
+    for j in prange(first_period.size):
+        x = rate[j]
+        converged = False
+        for _ in range(maxiter):
+            step = (_dirty_price_jit(first_period[j], nperiod[j], rate[j], x, redemption[j], frequency[j])
+                - dirty_price_target[j]) / _dirty_price_slope_jit(first_period[j], nperiod[j], rate[j], x, redemption[j], frequency[j])
+            if not np.isfinite(step) or x - step <= -100.0 * frequency[j]:
+                # the step overshoots to a yield where the price is undefined
+                break
+            x -= step
+            if abs(step) < 1e-10:
+                converged = True
+                break
+        if not converged:
+            # fall back to bisection, which always converges since the price decreases with yield
+            lower = yld_lower
+            upper = yld_upper
+            if (_dirty_price_jit(first_period[j], nperiod[j], rate[j], lower, redemption[j], frequency[j]) < dirty_price_target[j]
+                    or _dirty_price_jit(first_period[j], nperiod[j], rate[j], upper, redemption[j], frequency[j]) > dirty_price_target[j]):
+                # the yield is not bracketed, so bisection would only return a bracket edge
+                out[j] = np.nan
+                continue
+            while upper - lower > 1e-10:
+                x = 0.5 * (lower + upper)
+                if _dirty_price_jit(first_period[j], nperiod[j], rate[j], x, redemption[j], frequency[j]) > dirty_price_target[j]:
+                    lower = x
+                else:
+                    upper = x
+            x = 0.5 * (lower + upper)
+        out[j] = x
+
+
+def _dirty_price_rows(periods, CF_regular, yld, frequency, out):
+    '''Dirty price (in percent) of each row of a (bonds, coupons) batch; padded coupons carry a zero cash flow.'''
+    base = 1.0 + yld * 0.01 / frequency
+    total = 0.0
+    for i in range(periods.shape[0]):
+        total += CF_regular[i] * base ** -periods[i]
+    out[0] = total * 100
+
+
+@functools.lru_cache(maxsize=None)
+def _dirty_price_gufunc():
+    '''Parallel gufunc of _dirty_price_rows, built on first use so importing the package does not load it.'''
+    return guvectorize(['void(f8[:], f8[:], f8, i8, f8[:])'], '(n),(n),(),()->()', 
+        target='parallel', fastmath=True, cache=True)(_dirty_price_rows)
+
+
+def _aot_compiler():
+    '''Create the numba.pycc compiler for the fincomepy.bond_kernels extension.'''
+    # numba.pycc is only needed at build time, so it is not imported along with the package
+    from numba.pycc import CC
+    cc = CC('bond_kernels')
+    cc.export('dirty_price', 'f8(f8, i8, f8, f8, f8, i8)')(_dirty_price)
+    cc.export('dirty_price_slope', 'f8(f8, i8, f8, f8, f8, i8)')(_dirty_price_slope)
+    cc.export('convexity', 'f8(f8, i8, f8, f8, f8, i8, f8)')(_convexity)
+    return cc
+
@@ -1,9 +1,26 @@
 from datetime import date, timedelta
-from dateutil.relativedelta import relativedelta
+import calendar
+import functools
 import numpy as np
 import math
-from scipy.optimize import root
-from fincomepy.fixedincome import FixedIncome
+from scipy.optimize import newton, brentq
+from .fixedincome import FixedIncome
+try:
+    # scalar kernels compiled ahead of time when the package is built, see fincomepy/_kernels.py; 
+    # with these, importing the package does not import numba
+    from .bond_kernels import dirty_price as _dirty_price_kernel
+    from .bond_kernels import dirty_price_slope as _dirty_price_slope_kernel
+    from .bond_kernels import convexity as _convexity_kernel
+except ImportError:
+    from ._kernels import _dirty_price_jit as _dirty_price_kernel
+    from ._kernels import _dirty_price_slope_jit as _dirty_price_slope_kernel
+    from ._kernels import _convexity_jit as _convexity_kernel
+
+# yield bracket (in percent) for the bracketed fallback solves; dirty price is monotone in yield
+# on this interval for any coupon frequency
+_YLD_LOWER_PERC = -50.0
+_YLD_UPPER_PERC = 100.0
+
 
 class Bond(FixedIncome):
     '''
@@ -31,6 +48,20 @@ class Bond(FixedIncome):
         A date object which indicates the previous coupon payment date.
     _coupncd: datetime.date
         A date object which indicates the next coupon payment date.
+    _coupon_interval: int
+        An integer which indicates the number of months between coupon payments.
+    _nperiod: int
+        An integer which indicates the number of remaining coupon periods.
+    _first_period: float
+        A float which indicates the fraction of a coupon period until the next coupon payment.
+    _is_month_end: bool
+        A boolean which indicates whether the maturity date falls on the last day of its month.
+    _coupon_dates: list
+        A list of the remaining coupon payment dates, from maturity backwards.
+    _periods: np.array
+        A numpy array which contains the number of coupon periods until each remaining payment.
+    _cf_regular: np.array
+        A numpy array which contains the remaining cash flows (regular, per unit of par).
     _yld: float
         A float which indicates bond yield (in percent).
     _mac_duration: float
@@ -52,8 +83,12 @@ class Bond(FixedIncome):
         Calculate the accrued interest of coupon.
     dirty_price(settlement, maturity, rate, yld, redemption, frequency, basis)
         Calculate the dirty price of a bond.
+    dirty_price_batch(settlement, maturity, rate, yld, redemption, frequency, basis)
+        Calculate the dirty prices of a batch of bonds.
     yld(settlement, maturity, rate, pr, redemption, frequency, basis, *args, **kwargs)
         Calculate the yield of a bond.
+    yld_batch(settlement, maturity, rate, pr, redemption, frequency, basis, maxiter)
+        Calculate the yields of a batch of bonds.
     mac_duration()
         Calculate the Macaulay duration of a bond.
     mod_duration(yld_change_perc)
@@ -72,6 +107,10 @@ class Bond(FixedIncome):
         Obtain the coupon payment dates of a bond.
     '''
 
+    __slots__ = ('_settlement', '_maturity', '_frequency', '_basis', '_redemption', '_coupon_interval', 
+                 '_nperiod', '_is_month_end', '_coupon_dates', '_couppcd', '_coupncd', '_first_period', '_periods', '_cf_regular', 
+                 '_yld', '_mac_duration', '_mod_duration', '_DV01', '_convexity')
+
     def __init__(self, settlement, maturity, coupon_perc, price_perc, frequency, basis=1, redemption=100, yld=None):
         '''
         Constructor for Bond.
@@ -114,11 +153,21 @@ class Bond(FixedIncome):
         self._maturity = maturity
         self._perc_dict["coupon"] = coupon_perc
         self._perc_dict["clean_price"] = self._parse_price(price_perc)
-        self._frequency = frequency
+        self._frequency = Bond._parse_frequency(frequency)
         self._basis = basis
         self._redemption = redemption
-        self._couppcd = Bond.couppcd(settlement, maturity, frequency, basis)
-        self._coupncd = Bond.coupncd(settlement, maturity, frequency, basis)
+        self._coupon_interval = 12 // self._frequency
+        self._nperiod = Bond.get_nperiod(settlement, maturity, self._coupon_interval)
+        self._is_month_end = maturity == Bond.last_day_in_month(maturity)
+        self._coupon_dates = [Bond._coupon_date(maturity, self._coupon_interval, i, self._is_month_end) 
+                              for i in range(self._nperiod)]
+        self._couppcd = Bond._coupon_date(maturity, self._coupon_interval, self._nperiod, self._is_month_end)
+        self._coupncd = self._coupon_dates[-1]
+        self._first_period = Bond._get_first_period(self._couppcd, self._coupncd, settlement, self._frequency, basis)
+        self._periods = np.arange(self._nperiod, dtype=np.float64)
+        self._periods += self._first_period
+        self._cf_regular = np.full(self._nperiod, coupon_perc / self._frequency * 0.01)
+        self._cf_regular[-1] += redemption * 0.01
         self._perc_dict["accrint"] = Bond.accrint(issue=self._couppcd, first_interest=self._coupncd, settlement=self._settlement,
             rate=self._perc_dict["coupon"], par=1, frequency=self._frequency, basis=self._basis)
         self._perc_dict["dirty_price"] = self._perc_dict["clean_price"] + self._perc_dict["accrint"]
@@ -160,12 +209,9 @@ class Bond(FixedIncome):
         >>> print(pcd) 
         2020-05-15
         '''
-        coupon_interval = 12 / frequency
+        coupon_interval = 12 // Bond._parse_frequency(frequency)
         nperiod = Bond.get_nperiod(settlement, maturity, coupon_interval)
-        pcd = maturity - relativedelta(months=coupon_interval) * nperiod
-        if maturity == Bond.last_day_in_month(maturity):
-            return Bond.last_day_in_month(pcd)
-        return pcd
+        return Bond._coupon_date(maturity, coupon_interval, nperiod, maturity == Bond.last_day_in_month(maturity))
     
     @staticmethod
     def coupncd(settlement, maturity, frequency, basis):
@@ -198,12 +244,16 @@ class Bond(FixedIncome):
         >>> print(ncd)
         2020-11-15
         '''
-        coupon_interval = 12 / frequency
+        coupon_interval = 12 // Bond._parse_frequency(frequency)
         nperiod = Bond.get_nperiod(settlement, maturity, coupon_interval)
-        ncd = maturity - relativedelta(months=coupon_interval) * (nperiod - 1)
-        if maturity == Bond.last_day_in_month(maturity):
-            return Bond.last_day_in_month(ncd)
-        return ncd
+        return Bond._coupon_date(maturity, coupon_interval, nperiod - 1, maturity == Bond.last_day_in_month(maturity))
+
+    @staticmethod
+    def _coupon_date(maturity, coupon_interval, n, is_month_end):
+        coupon_date = Bond._subtract_months(maturity, coupon_interval * n)
+        if is_month_end:
+            return coupon_date.replace(day=calendar.monthrange(coupon_date.year, coupon_date.month)[1])
+        return coupon_date
     
     @staticmethod
     def accrint(issue, first_interest, settlement, rate, par=1.0, frequency=2, basis=1):
@@ -320,23 +370,81 @@ class Bond(FixedIncome):
         >>> print(dirty_price)
         100.11968449222717
         '''
-        pcd = Bond.couppcd(settlement, maturity, frequency, basis)
-        ncd = Bond.coupncd(settlement, maturity, frequency, basis)
-        first_period = Bond._first_period(pcd, ncd, settlement, frequency, basis)
-        coupon_interval = 12 / frequency  
+        frequency = Bond._parse_frequency(frequency)
+        _, _, first_period, nperiod = Bond._period_info(settlement, maturity, frequency, basis)
+        return _dirty_price_kernel(first_period, nperiod, rate, yld, redemption, frequency)
+
+    @staticmethod
+    def dirty_price_batch(settlement, maturity, rate, yld, redemption, frequency, basis):
+        '''Calculate the dirty prices of a batch of bonds.
+
+        All inputs are broadcast against each other, so quantities shared by every bond
+        (e.g. settlement, frequency or basis) can be passed as scalars.
+
+        Parameters
+        ----------
+        settlement: datetime.date or array_like
+            The settlement date(s) of the bonds.
+        maturity: datetime.date or array_like
+            The maturity date(s) of the bonds.
+        rate: float or array_like
+            The coupon rate(s) (in percent) of the bonds.
+        yld: float or array_like
+            The yield(s) (in percent) of the bonds. 
+        redemption: float or array_like
+            The redemption(s) (in percent) of the bonds. 
+        frequency: int or array_like
+            The coupon payment frequency of the bonds.
+        basis: int or array_like
+            The day count convention of the bonds. 
+            0: 30/360
+            1: actual/actual
+            2: actual/360
+            3: actual/365
+            4: 30E/360
+        
+        Returns
+        -------
+        np.array
+            A numpy array which contains the bond dirty prices (in percent).
+        
+        Examples
+        --------
+        >>> prices = Bond.dirty_price_batch(settlement=date(2020,7,15), maturity=[date(2030,5,15), date(2025,6,30)],
+            rate=[0.625, 0.25], yld=[0.6233, 0.2881], redemption=100, frequency=2, basis=1)
+        >>> print(prices)
+        [100.11968449  99.82271389]
+        '''
+        inputs = np.broadcast_arrays(*[np.asarray(item, dtype=object) 
+            for item in (settlement, maturity, rate, yld, redemption, frequency, basis)])
+        bonds = list(zip(*[item.ravel() for item in inputs]))
+        period_info = [Bond._period_info(settle, mat, freq, day_count) 
+            for settle, mat, _, _, _, freq, day_count in bonds]
+        # cash flows of all bonds laid out as (bonds, coupons) rows, padded with zero cash flows
+        periods = np.zeros((len(bonds), max([item[3] for item in period_info], default=1)), dtype=np.float64)
+        CF_regular = np.zeros_like(periods)
+        for j, ((_, _, coupon, _, red, freq, _), (_, _, first_period, nperiod)) in enumerate(zip(bonds, period_info)):
+            periods[j, :nperiod] = np.arange(nperiod, dtype=np.float64)
+            periods[j, :nperiod] += first_period
+            CF_regular[j, :nperiod] = coupon / freq * 0.01
+            CF_regular[j, nperiod - 1] += red * 0.01
+        from ._kernels import _dirty_price_gufunc
+        dirty_price = _dirty_price_gufunc()(periods, CF_regular, inputs[3].ravel().astype(np.float64), 
+            inputs[5].ravel().astype(np.int64))
+        return dirty_price.reshape(inputs[0].shape)
+
+    @staticmethod
+    def _period_info(settlement, maturity, frequency, basis):
+        coupon_interval = 12 // Bond._parse_frequency(frequency)
         nperiod = Bond.get_nperiod(settlement, maturity, coupon_interval)  
-        periods = np.array([first_period + i for i in range(nperiod)])
-        CF_perc = np.array([rate / frequency] * nperiod)
-        CF_perc[-1] += redemption 
-        CF_regular = CF_perc * 0.01
-        yld_regular = yld * 0.01
-        DF = 1 / (1 + yld_regular / frequency) ** periods
-        CF_PV = CF_regular * DF
-        CF_PV_total = sum(CF_PV)
-        return CF_PV_total * 100  
+        is_month_end = maturity == Bond.last_day_in_month(maturity)
+        pcd = Bond._coupon_date(maturity, coupon_interval, nperiod, is_month_end)
+        ncd = Bond._coupon_date(maturity, coupon_interval, nperiod - 1, is_month_end)
+        first_period = Bond._get_first_period(pcd, ncd, settlement, frequency, basis)
+        return (pcd, ncd, first_period, nperiod)
 
     @staticmethod
-    def _first_period(pcd, ncd, settlement, frequency, basis):
+    def _get_first_period(pcd, ncd, settlement, frequency, basis):
         if basis == 1:
             denom_days = (ncd - pcd).days
         elif basis in [0, 2, 4]:
@@ -381,9 +489,9 @@ class Bond(FixedIncome):
             3: actual/365
             4: 30E/360
         *args : optional
-            Positional argument passed to scipy.optimize.root.
+            Positional argument passed to scipy.optimize.newton.
         **kwargs : optional
-            Keyword argument passed to scipy.optimize.root. 
+            Keyword argument passed to scipy.optimize.newton. 
         
         Returns
         -------
@@ -397,30 +505,102 @@ class Bond(FixedIncome):
         >>> print(yld)
         0.62334818110842
         '''
-        pcd = Bond.couppcd(settlement, maturity, frequency, basis)
-        ncd = Bond.coupncd(settlement, maturity, frequency, basis)
+        frequency = Bond._parse_frequency(frequency)
+        pcd, ncd, first_period, nperiod = Bond._period_info(settlement, maturity, frequency, basis)
         accrued_interest = Bond.accrint(issue=pcd, first_interest=ncd, settlement=settlement, rate=rate, par=1, frequency=frequency, basis=basis)
         dirty_price_target = accrued_interest + pr
-        sol = root(lambda x: Bond.dirty_price(settlement, maturity, rate, x, redemption, frequency, basis) - dirty_price_target, 
-            [0.01], *args, **kwargs)
-        yld = sol.x[0]
+        return Bond._solve_yld(first_period, nperiod, rate, dirty_price_target, redemption, frequency, *args, **kwargs)
+
+    @staticmethod
+    def _solve_yld(first_period, nperiod, rate, dirty_price_target, redemption, frequency, *args, **kwargs):
+        price_diff = lambda x: _dirty_price_kernel(first_period, nperiod, rate, x, redemption, frequency) - dirty_price_target
+        price_slope = lambda x: _dirty_price_slope_kernel(first_period, nperiod, rate, x, redemption, frequency)
+        kwargs.setdefault("tol", 1e-10)
+        # newton has to raise when it does not converge, otherwise the fallback below never runs
+        kwargs["disp"] = True
+        try:
+            yld = newton(price_diff, rate, price_slope, *args, **kwargs)
+        except (RuntimeError, ArithmeticError):
+            yld = math.nan
+        if not math.isfinite(yld):
+            # Newton failed to converge, use a bracketed solve which is guaranteed to converge on 
+            # [_YLD_LOWER_PERC, _YLD_UPPER_PERC]
+            yld = brentq(price_diff, _YLD_LOWER_PERC, _YLD_UPPER_PERC, xtol=1e-10, rtol=1e-12)
         #assert yld >= 0 and yld <= 100
         return yld
 
-    def _intermediate_values(self):
-        coupon_interval = 12 / self._frequency  
-        nperiod = Bond.get_nperiod(self._settlement, self._maturity, coupon_interval)
-        first_period = Bond._first_period(self._couppcd, self._coupncd , self._settlement, self._frequency, self._basis)
-        periods = np.array([first_period + i for i in range(nperiod)])
-        CF_perc = np.array([self._perc_dict["coupon"] / self._frequency] * nperiod)
-        CF_perc[-1] += self._redemption
-        CF_regular = CF_perc * 0.01
+    @staticmethod
+    def yld_batch(settlement, maturity, rate, pr, redemption, frequency, basis, maxiter=50):
+        '''Calculate the yields of a batch of bonds.
+
+        All inputs are broadcast against each other, so quantities shared by every bond
+        (e.g. settlement, frequency or basis) can be passed as scalars.
+
+        Parameters
+        ----------
+        settlement: datetime.date or array_like
+            The settlement date(s) of the bonds.
+        maturity: datetime.date or array_like
+            The maturity date(s) of the bonds.
+        rate: float or array_like
+            The coupon rate(s) (in percent) of the bonds.
+        pr: float or array_like
+            The clean price(s) (in percent) of the bonds. 
+        redemption: float or array_like
+            The redemption(s) (in percent) of the bonds. 
+        frequency: int or array_like
+            The coupon payment frequency of the bonds.
+        basis: int or array_like
+            The day count convention of the bonds. 
+            0: 30/360
+            1: actual/actual
+            2: actual/360
+            3: actual/365
+            4: 30E/360
+        maxiter: int, optional
+            The maximum number of Newton iterations per bond. Bonds which do not converge within 
+            maxiter iterations are solved by bisection on [-50, 100] percent instead. Default is 50.
+        
+        Returns
+        -------
+        np.array
+            A numpy array which contains the bond yields (in percent). Yields which are left to the 
+            bisection and lie outside [-50, 100] percent are NaN.
+        
+        Examples
+        --------
+        >>> ylds = Bond.yld_batch(settlement=date(2020,7,15), maturity=[date(2030,5,15), date(2025,6,30)],
+            rate=[0.625, 0.25], pr=[100.015625, 99.8125], redemption=100, frequency=2, basis=1)
+        >>> print(ylds)
+        [0.62334818 0.28810482]
+        '''
+        inputs = np.broadcast_arrays(*[np.asarray(item, dtype=object) 
+            for item in (settlement, maturity, rate, pr, redemption, frequency, basis)])
+        nbond = inputs[0].size
+        first_period = np.empty(nbond, dtype=np.float64)
+        nperiod = np.empty(nbond, dtype=np.int64)
+        dirty_price_target = np.empty(nbond, dtype=np.float64)
+        for j, (settle, mat, coupon, price, _, freq, day_count) in enumerate(zip(*[item.ravel() for item in inputs])):
+            pcd, ncd, first_period[j], nperiod[j] = Bond._period_info(settle, mat, freq, day_count)
+            dirty_price_target[j] = Bond.accrint(issue=pcd, first_interest=ncd, settlement=settle, rate=coupon, 
+                par=1, frequency=freq, basis=day_count) + price
+        yld = np.empty(nbond, dtype=np.float64)
+        from ._kernels import _yld_batch_kernel
+        _yld_batch_kernel(first_period, nperiod, inputs[2].ravel().astype(np.float64), dirty_price_target, 
+            inputs[4].ravel().astype(np.float64), inputs[5].ravel().astype(np.int64), maxiter, 
+            _YLD_LOWER_PERC, _YLD_UPPER_PERC, yld)
+        return yld.reshape(inputs[0].shape)
+
+    def _ensure_yld(self):
         if self._yld is None:
-            self._yld = self.yld(self._settlement, self._maturity, self._perc_dict["coupon"], self._perc_dict["clean_price"],
-                                 self._redemption, self._frequency, self._basis)
-        yield_regular = self._yld * 0.01
-        DF = 1 / (1 + yield_regular / self._frequency) ** periods
-        return (periods, CF_regular, DF)
+            self._yld = Bond._solve_yld(self._first_period, self._nperiod, self._perc_dict["coupon"], 
+                                        self._perc_dict["dirty_price"], self._redemption, self._frequency)
+        return self._yld
+
+    def _intermediate_values(self):
+        yield_regular = self._ensure_yld() * 0.01
+        DF = np.exp(-np.log1p(yield_regular / self._frequency) * self._periods)
+        return (self._periods, self._cf_regular, DF)
     
     def mac_duration(self):
         '''Calculate the Macaulay duration of a bond.
@@ -435,14 +615,13 @@ class Bond(FixedIncome):
         >>> bond_test = Bond(settlement=date(2020,7,15), maturity=date(2030,5,15),
             coupon_perc=0.625, price_perc=100.015625, frequency=2, basis=1)
         >>> bond_test.mac_duration()
-        9.543778095004477
+        9.543778095004486
         '''
-        if self._mac_duration:
+        if self._mac_duration is not None:
             return self._mac_duration
         periods, CF_regular, DF = self._intermediate_values()
         CF_PV = CF_regular * DF
-        CF_PV_times_p = CF_PV * periods
-        self._mac_duration = CF_PV_times_p.sum() / self._reg_dict["dirty_price"] / self._frequency
+        self._mac_duration = (CF_PV @ periods) / self._reg_dict["dirty_price"] / self._frequency
         return self._mac_duration
 
     def mod_duration(self, yld_change_perc=0.01):
@@ -451,8 +630,8 @@ class Bond(FixedIncome):
         Parameters
         ----------
         yld_change_perc: float, optional
-            A float which specifies the yield change when calculating modified duration.
-            Default is 0.01.
+            Unused. The modified duration is computed in closed form from the Macaulay duration, 
+            so no yield bump is needed. Kept for backward compatibility. Default is 0.01.
         
         Returns
         -------
@@ -464,26 +643,11 @@ class Bond(FixedIncome):
         >>> bond_test = Bond(settlement=date(2020,7,15), maturity=date(2030,5,15),
             coupon_perc=0.625, price_perc=100.015625, frequency=2, basis=1)
         >>> bond_test.mod_duration()
-        9.51412677103921
+        9.51412503233576
         '''
-        if self._mod_duration:
+        if self._mod_duration is not None:
             return self._mod_duration
-        if not self._yld:
-            original_yield_perc = self.yld(self._settlement, self._maturity, self._perc_dict["coupon"], self._perc_dict["clean_price"],
-                                           self._redemption, self._frequency, self._basis)
-        else:
-            original_yield_perc = self._yld
-        yield_up_perc = original_yield_perc + yld_change_perc
-        yield_down_perc = original_yield_perc - yld_change_perc
-        dirty_price_up_perc = self.dirty_price(self._settlement, self._maturity, self._perc_dict["coupon"], yield_up_perc,
-                                               self._redemption, self._frequency, self._basis)  
-        dirty_price_down_perc = self.dirty_price(self._settlement, self._maturity, self._perc_dict["coupon"], yield_down_perc,
-                                               self._redemption, self._frequency, self._basis) 
-        price_change_up_perc = dirty_price_up_perc - self._perc_dict["dirty_price"]
-        price_change_down_perc = dirty_price_down_perc - self._perc_dict["dirty_price"]
-        relative_change_up = price_change_up_perc / self._perc_dict["dirty_price"]
-        relative_change_down = price_change_down_perc / self._perc_dict["dirty_price"]
-        self._mod_duration = (abs(relative_change_up) + abs(relative_change_down)) / 2 / (yld_change_perc * 0.01) 
+        self._mod_duration = self.mac_duration() / (1 + self._ensure_yld() * 0.01 / self._frequency)
         return self._mod_duration
     
     def DV01(self):
@@ -499,9 +663,9 @@ class Bond(FixedIncome):
         >>> bond_test = Bond(settlement=date(2020,7,15), maturity=date(2030,5,15),
             coupon_perc=0.625, price_perc=100.015625, frequency=2, basis=1)
         >>> bond_test.DV01()
-        9.525470040389195
+        9.525468299612765
         '''
-        if self._DV01:
+        if self._DV01 is not None:
             return self._DV01
         if self._mod_duration is None:
             self.mod_duration()
@@ -521,20 +685,12 @@ class Bond(FixedIncome):
         >>> bond_test = Bond(settlement=date(2020,7,15), maturity=date(2030,5,15),
             coupon_perc=0.625, price_perc=100.015625, frequency=2, basis=1)
         >>> bond_test.convexity()
-        97.06268930241025
+        97.06268930241015
         '''
-        if self._convexity:
+        if self._convexity is not None:
             return self._convexity
-        periods, CF_regular, DF = self._intermediate_values()
-        CF_PV = CF_regular * DF
-        CF_PV_times_p = CF_PV * periods
-        CF_PV_times_p_2 = CF_PV * periods * periods
-        all = (CF_PV_times_p + CF_PV_times_p_2) / self._reg_dict["dirty_price"]
-        if not self._yld:
-            self._yld = self.yld(self._settlement, self._maturity, self._perc_dict["coupon"], self._perc_dict["clean_price"],
-                                 self._redemption, self._frequency, self._basis)
-        yield_regular = self._yld * 0.01
-        self._convexity = all.sum() / (4 * (1 + yield_regular / self._frequency) ** 2)
+        self._convexity = _convexity_kernel(self._first_period, self._nperiod, self._perc_dict["coupon"], self._ensure_yld(), 
+                                            self._redemption, self._frequency, self._reg_dict["dirty_price"])
         return self._convexity
     
     def price_change(self, yld_change_perc):
@@ -556,7 +712,7 @@ class Bond(FixedIncome):
             coupon_perc=0.625, price_perc=100.015625, frequency=2, basis=1)
         >>> # For 0.1% change in yield, the bond price will change by:    
         >>> bond_test.price_change(yld_change_perc=0.1)
-        -0.9476880833978572
+        -0.9476879093202143
         '''
         DV01 = self.DV01()
         convexity = self.convexity()
@@ -565,6 +721,7 @@ class Bond(FixedIncome):
         return price_change_reg * 100
             
     @staticmethod
+    @functools.lru_cache(maxsize=4096)
     def diff_month(date1, date2):
         '''Get the month difference between two dates.
 
@@ -583,6 +740,7 @@ class Bond(FixedIncome):
         return (date2.year - date1.year) * 12 + date2.month - date1.month
     
     @staticmethod
+    @functools.lru_cache(maxsize=4096)
     def last_day_in_month(original_date):
         '''Get the last day for the input month.
 
@@ -616,6 +774,13 @@ class Bond(FixedIncome):
             return int(firstnum) + (int(secondnum[:-1]) + 0.5) / 32
         return int(firstnum) + int(secondnum) / 32
 
+    @staticmethod
+    def _parse_frequency(frequency):
+        # coupon dates are whole months apart, so the frequency has to be an integer divisor of 12
+        if frequency != int(frequency) or frequency <= 0 or 12 % int(frequency) != 0:
+            raise ValueError('frequency should be an integer which divides 12.')
+        return int(frequency)
+
     def coupon_dates(self):
         '''Obtain the coupon payment dates of a bond.
 
@@ -624,19 +789,23 @@ class Bond(FixedIncome):
         list
             A list of coupon payment dates.
         '''
-        coupon_interval = 12 / self._frequency
-        periods = Bond.get_nperiod(self._settlement, self._maturity, coupon_interval)
-        coupon_dates = [self._maturity - relativedelta(months=coupon_interval) * i for i in range(periods)]
-        if self._maturity == Bond.last_day_in_month(self._maturity):
-            coupon_dates = [Bond.last_day_in_month(item) for item in coupon_dates]
-        return coupon_dates
+        return list(self._coupon_dates)
 
     @staticmethod
     def get_nperiod(settlement, maturity, coupon_interval):
         assert settlement < maturity
-        nperiod = 0
-        while maturity - relativedelta(months=coupon_interval) * nperiod > settlement:
+        # coupon dates within whole coupon intervals of the settlement month are all later than 
+        # settlement, so the search can start from there
+        nperiod = Bond.diff_month(settlement, maturity) // coupon_interval
+        while Bond._subtract_months(maturity, coupon_interval * nperiod) > settlement:
             nperiod += 1
         return nperiod
 
+    @staticmethod
+    def _subtract_months(original_date, months):
+        total = original_date.year * 12 + original_date.month - 1 - months
+        year, month = divmod(total, 12)
+        day = min(original_date.day, calendar.monthrange(year, month + 1)[1])
+        return date(year, month + 1, day)
+
 
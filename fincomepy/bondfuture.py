@@ -1,8 +1,7 @@
 from datetime import date, timedelta
 import numpy as np
 import bisect
-from fincomepy.fixedincome import FixedIncome
-from fincomepy.bond import Bond
+from .bond import Bond
 
 class BondFuture(Bond):
     '''
@@ -30,6 +29,20 @@ class BondFuture(Bond):
         A date object which indicates the previous coupon payment date.
     _coupncd: datetime.date
         A date object which indicates the next coupon payment date.
+    _coupon_interval: int
+        An integer which indicates the number of months between coupon payments.
+    _nperiod: int
+        An integer which indicates the number of remaining coupon periods.
+    _first_period: float
+        A float which indicates the fraction of a coupon period until the next coupon payment.
+    _is_month_end: bool
+        A boolean which indicates whether the maturity date falls on the last day of its month.
+    _coupon_dates: list
+        A list of the remaining coupon payment dates, from maturity backwards.
+    _periods: np.array
+        A numpy array which contains the number of coupon periods until each remaining payment.
+    _cf_regular: np.array
+        A numpy array which contains the remaining cash flows (regular, per unit of par).
     _yld: float
         A float which indicates bond yield (in percent).
     _mac_duration: float
@@ -63,8 +76,12 @@ class BondFuture(Bond):
         Calculate the accrued interest of coupon.
     dirty_price(settlement, maturity, rate, yld, redemption, frequency, basis)
         Calculate the dirty price of a bond.
+    dirty_price_batch(settlement, maturity, rate, yld, redemption, frequency, basis)
+        Calculate the dirty prices of a batch of bonds.
     yld(settlement, maturity, rate, pr, redemption, frequency, basis, *args, **kwargs)
         Calculate the yield of a bond.
+    yld_batch(settlement, maturity, rate, pr, redemption, frequency, basis, maxiter)
+        Calculate the yields of a batch of bonds.
     mac_duration()
         Calculate the Macaulay duration of a bond.
     mod_duration(yld_change_perc)
@@ -89,8 +106,17 @@ class BondFuture(Bond):
         Calculate net basis of bond future.
     implied_repo_rate()
         Calculate implied repo rate.
+    forward_price_batch(dirty_price_perc, repo_rate_perc, repo_period, type)
+        Calculate the forward prices of a batch of bonds.
+    net_basis_batch(dirty_price_perc, repo_rate_perc, repo_period, future_val_perc, type)
+        Calculate the net basis of a batch of deliverable bonds.
+    implied_repo_rate_batch(dirty_price_perc, future_val_perc, repo_period, type)
+        Calculate the implied repo rates of a batch of deliverable bonds.
     '''
 
+    __slots__ = ('_repo_period', '_repo_end_date', '_conversion_factor', '_type', '_invoice_pr_perc', 
+                 '_forward_pr_perc', '_future_val_perc')
+
     def __init__(self, settlement, maturity, coupon_perc, price_perc, frequency, basis, 
                  repo_period, repo_rate_perc, futures_pr_perc, conversion_factor, type='US'):
         '''
@@ -213,11 +239,10 @@ class BondFuture(Bond):
         >>> bf_test.forward_price()
         113.45529615319292
         '''
-        days_in_year = 360 if self._type == 'US' else 365
-        if self._forward_pr_perc:
+        if self._forward_pr_perc is not None:
             return self._forward_pr_perc
-        forward_pr_reg = self._reg_dict["dirty_price"] *  (1 + self._reg_dict["repo_rate"] * self._repo_period / days_in_year)
-        self._forward_pr_perc = forward_pr_reg * 100
+        self._forward_pr_perc = BondFuture.forward_price_batch(self._perc_dict["dirty_price"], self._perc_dict["repo_rate"], 
+            self._repo_period, self._type)
         return self._forward_pr_perc
     
     def full_future_val(self):
@@ -236,7 +261,7 @@ class BondFuture(Bond):
         >>> bf_test.full_future_val()
         113.444575
         '''
-        if self._future_val_perc:
+        if self._future_val_perc is not None:
             return self._future_val_perc
         days_in_year = 360 if self._type == 'US' else 365
         temp = list(self.coupon_dates())
@@ -246,7 +271,7 @@ class BondFuture(Bond):
         coupon_FV = 0.0 
         if not coupon_dates:
             accrint_perc = Bond.accrint(self._couppcd, self._coupncd, self._repo_end_date, 
-                self._perc_dict["coupon"], par=1, frequency=2, basis=1)
+                self._perc_dict["coupon"], par=1, frequency=self._frequency, basis=self._basis)
         else:
             for item in coupon_dates:
                 reinvestment_days = (self._repo_end_date - item).days
@@ -293,7 +318,97 @@ class BondFuture(Bond):
         >>> bf_test.implied_repo_rate()
         0.09462834553701782
         '''
-        days_in_year = 360 if self._type == 'US' else 365
-        implied_repo_reg = (self.full_future_val() / self._perc_dict["dirty_price"] - 1) * days_in_year / self._repo_period
+        return BondFuture.implied_repo_rate_batch(self._perc_dict["dirty_price"], self.full_future_val(), 
+            self._repo_period, self._type)
+
+    @staticmethod
+    def forward_price_batch(dirty_price_perc, repo_rate_perc, repo_period, type='US'):
+        '''Calculate the forward prices of a batch of bonds.
+
+        All inputs are broadcast against each other.
+
+        Parameters
+        ----------
+        dirty_price_perc: float or np.array
+            The dirty price(s) (in percent) of the bonds.
+        repo_rate_perc: float or np.array
+            The repo interest rate(s) (in percent).
+        repo_period: int or np.array
+            The repo period(s) (in days).
+        type: str, optional
+            A string which specifies the money market of repo. It should be either 'US' or 'UK'.
+            Default is 'US'.
+
+        Returns
+        -------
+        np.array
+            A numpy array which contains the forward prices (in percent) of the bonds.
+        
+        Examples
+        --------
+        >>> BondFuture.forward_price_batch(dirty_price_perc=np.array([113.4222, 121.7839]), 
+            repo_rate_perc=np.array([0.14, 0.588]), repo_period=np.array([75, 152]), type='US')
+        array([113.45528147, 122.08624883])
+        '''
+        days_in_year = 360 if type == 'US' else 365
+        dirty_price_perc = np.asarray(dirty_price_perc, dtype=np.float64)
+        repo_rate_perc = np.asarray(repo_rate_perc, dtype=np.float64)
+        return dirty_price_perc * (1 + repo_rate_perc * 0.01 * np.asarray(repo_period) / days_in_year)
+
+    @staticmethod
+    def net_basis_batch(dirty_price_perc, repo_rate_perc, repo_period, future_val_perc, type='US'):
+        '''Calculate the net basis of a batch of deliverable bonds.
+
+        All inputs are broadcast against each other.
+
+        Parameters
+        ----------
+        dirty_price_perc: float or np.array
+            The dirty price(s) (in percent) of the bonds.
+        repo_rate_perc: float or np.array
+            The repo interest rate(s) (in percent).
+        repo_period: int or np.array
+            The repo period(s) (in days).
+        future_val_perc: float or np.array
+            The full future value(s) (in percent) of the bonds, see full_future_val().
+        type: str, optional
+            A string which specifies the money market of repo. It should be either 'US' or 'UK'.
+            Default is 'US'.
+
+        Returns
+        -------
+        np.array
+            A numpy array which contains the net basis (in 32nd) of the bonds.
+        '''
+        forward_pr_perc = BondFuture.forward_price_batch(dirty_price_perc, repo_rate_perc, repo_period, type)
+        return (forward_pr_perc - np.asarray(future_val_perc, dtype=np.float64)) * 32
+
+    @staticmethod
+    def implied_repo_rate_batch(dirty_price_perc, future_val_perc, repo_period, type='US'):
+        '''Calculate the implied repo rates of a batch of deliverable bonds.
+
+        All inputs are broadcast against each other.
+
+        Parameters
+        ----------
+        dirty_price_perc: float or np.array
+            The dirty price(s) (in percent) of the bonds.
+        future_val_perc: float or np.array
+            The full future value(s) (in percent) of the bonds, see full_future_val().
+        repo_period: int or np.array
+            The repo period(s) (in days).
+        type: str, optional
+            A string which specifies the money market of repo. It should be either 'US' or 'UK'.
+            Default is 'US'.
+
+        Returns
+        -------
+        np.array
+            A numpy array which contains the implied repo rates (in percent).
+        '''
+        days_in_year = 360 if type == 'US' else 365
+        dirty_price_perc = np.asarray(dirty_price_perc, dtype=np.float64)
+        future_val_perc = np.asarray(future_val_perc, dtype=np.float64)
+        implied_repo_reg = (future_val_perc / dirty_price_perc - 1) * days_in_year / np.asarray(repo_period)
         return implied_repo_reg * 100
 
@@ -1,5 +1,5 @@
 import numpy as np
-from fincomepy.fixedincome import FixedIncome
+from .fixedincome import FixedIncome
 
 class CDS(FixedIncome):
     '''
@@ -105,19 +105,19 @@ class CDS(FixedIncome):
         '''
         if self._cds_spread is not None:
             return self._cds_spread
-        df_risk_free = []
-        df_risky = []
-        df_risk_free.append(self._reg_dict["face_value"] / (self._reg_dict["face_value"] + self._reg_dict["risk_free"][0]))
-        df_risky.append(self._reg_dict["face_value"] / (self._reg_dict["face_value"] + self._reg_dict["risky"][0]))
+        df_risk_free = np.empty(self._reg_dict["risk_free"].size, dtype=np.float64)
+        df_risky = np.empty(self._reg_dict["risky"].size, dtype=np.float64)
+        df_risk_free[0] = self._reg_dict["face_value"] / (self._reg_dict["face_value"] + self._reg_dict["risk_free"][0])
+        df_risky[0] = self._reg_dict["face_value"] / (self._reg_dict["face_value"] + self._reg_dict["risky"][0])
+        df_risk_free_total = df_risk_free[0]
+        df_risky_total = df_risky[0]
         for i in range(1, self._reg_dict["risk_free"].size):
-            df1 = (self._reg_dict["face_value"] - self._reg_dict["risk_free"][i] * sum(df_risk_free)) / \
+            df_risk_free[i] = (self._reg_dict["face_value"] - self._reg_dict["risk_free"][i] * df_risk_free_total) / \
                 (self._reg_dict["face_value"] + self._reg_dict["risk_free"][i])
-            df2 = (self._reg_dict["face_value"] - self._reg_dict["risky"][i] * sum(df_risky)) / \
+            df_risky[i] = (self._reg_dict["face_value"] - self._reg_dict["risky"][i] * df_risky_total) / \
                 (self._reg_dict["face_value"] + self._reg_dict["risky"][i])
-            df_risk_free.append(df1)
-            df_risky.append(df2)
-        df_risk_free = np.array(df_risk_free)
-        df_risky = np.array(df_risky)
+            df_risk_free_total += df_risk_free[i]
+            df_risky_total += df_risky[i]
         df_risk_free_shift = np.insert(df_risk_free[:-1], 0, 1.0)
         df_risky_shift = np.insert(df_risky[:-1], 0, 1.0)
         # expected_loss = 1.0 - df_risky / df_risk_free
@@ -127,11 +127,9 @@ class CDS(FixedIncome):
         survival_prob_shift = np.insert(survival_prob[:-1], 0, 1.0)
         temp1 = survival_prob_shift * hazard_rates * df_risk_free
         temp2 = survival_prob * df_risk_free
-        cds_spread_reg = []
-        for i in range(1, self._reg_dict["risk_free"].size + 1):
-            s = (1.0 - self._reg_dict["rr"]) * temp1[:i].sum() / (temp1[:i].sum() + temp2[:i].sum())
-            cds_spread_reg.append(s)
-        self._cds_spread = np.array(cds_spread_reg) * 100
+        temp1_total = temp1.cumsum()
+        cds_spread_reg = (1.0 - self._reg_dict["rr"]) * temp1_total / (temp1_total + temp2.cumsum())
+        self._cds_spread = cds_spread_reg * 100
         return self._cds_spread
 
 
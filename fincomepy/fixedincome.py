@@ -19,6 +19,8 @@ class FixedIncome(object):
     update_dict()
         Update both _reg_dict and _perc_dict.
     '''
+
+    __slots__ = ('_reg_dict', '_perc_dict')
     
     def __init__(self):
         self._reg_dict = {}
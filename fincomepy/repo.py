@@ -1,8 +1,7 @@
 from datetime import date, timedelta
+import warnings
 import numpy as np
-from scipy.optimize import root
-from fincomepy.fixedincome import FixedIncome
-from fincomepy.bond import Bond
+from .bond import Bond
 
 class Repo(Bond):
     '''
@@ -30,6 +29,20 @@ class Repo(Bond):
         A date object which indicates the previous coupon payment date.
     _coupncd: datetime.date
         A date object which indicates the next coupon payment date.
+    _coupon_interval: int
+        An integer which indicates the number of months between coupon payments.
+    _nperiod: int
+        An integer which indicates the number of remaining coupon periods.
+    _first_period: float
+        A float which indicates the fraction of a coupon period until the next coupon payment.
+    _is_month_end: bool
+        A boolean which indicates whether the maturity date falls on the last day of its month.
+    _coupon_dates: list
+        A list of the remaining coupon payment dates, from maturity backwards.
+    _periods: np.array
+        A numpy array which contains the number of coupon periods until each remaining payment.
+    _cf_regular: np.array
+        A numpy array which contains the remaining cash flows (regular, per unit of par).
     _yld: float
         A float which indicates bond yield (in percent).
     _mac_duration: float
@@ -63,8 +76,12 @@ class Repo(Bond):
         Calculate the accrued interest of coupon.
     dirty_price(settlement, maturity, rate, yld, redemption, frequency, basis)
         Calculate the dirty price of a bond.
+    dirty_price_batch(settlement, maturity, rate, yld, redemption, frequency, basis)
+        Calculate the dirty prices of a batch of bonds.
     yld(settlement, maturity, rate, pr, redemption, frequency, basis, *args, **kwargs)
         Calculate the yield of a bond.
+    yld_batch(settlement, maturity, rate, pr, redemption, frequency, basis, maxiter)
+        Calculate the yields of a batch of bonds.
     mac_duration()
         Calculate the Macaulay duration of a bond.
     mod_duration(yld_change_perc)
@@ -97,6 +114,9 @@ class Repo(Bond):
         Calculate bond break even yield.
     '''
 
+    __slots__ = ('_repo_period', '_face_value', '_repo_end_date', '_type', '_start_payment', '_end_payment', 
+                 '_forward_date', '_price_change')
+
     def __init__(self, settlement, maturity, coupon_perc, price_perc, frequency, basis, 
                  bond_face_value, repo_period, repo_rate_perc, type='US'):
         '''
@@ -211,7 +231,7 @@ class Repo(Bond):
         >>> repo_test.start_payment()
         100041100.54347825
         '''
-        if self._start_payment:
+        if self._start_payment is not None:
             return self._start_payment
         self._start_payment = self._face_value * self._reg_dict["dirty_price"]
         return self._start_payment
@@ -233,7 +253,7 @@ class Repo(Bond):
         100041503.48679988
         '''
         days_in_year = 360 if self._type == 'US' else 365
-        if self._end_payment:
+        if self._end_payment is not None:
             return self._end_payment
         repo_interest = self._start_payment * self._reg_dict["repo_rate"] * self._repo_period / days_in_year
         end_payment = self._start_payment + repo_interest
@@ -278,7 +298,7 @@ class Repo(Bond):
         '''
         start_payment = bond_face_value * dirty_price_perc * 0.01
         if margin_perc and haircut_perc:
-            print("Warning: both margin and haircut are provided. Only margin is used.")
+            warnings.warn("Both margin and haircut are provided. Only margin is used.")
         if margin_perc:
             return start_payment / margin_perc * 100
         if haircut_perc:
@@ -380,9 +400,9 @@ class Repo(Bond):
         Parameters
         ----------
         *args : optional
-            Positional argument passed to scipy.optimize.root.
+            Positional argument passed to scipy.optimize.newton.
         **kwargs : optional
-            Keyword argument passed to scipy.optimize.root. 
+            Keyword argument passed to scipy.optimize.newton. 
 
         Returns
         -------
@@ -404,9 +424,8 @@ class Repo(Bond):
         self._price_change = forward_clean_price_perc - self._perc_dict["clean_price"]
         forward_DP_regular = self._end_payment / self._face_value
         forward_DP_perc = forward_DP_regular * 100
-        sol = root(lambda x: self.dirty_price(self._settlement, self._maturity, self._perc_dict["coupon"], 
-            x, self._redemption, self._frequency, self._basis) - forward_DP_perc, [0.01], *args, **kwargs)
-        forward_yield_perc = sol.x[0]
+        forward_yield_perc = Bond._solve_yld(self._first_period, self._nperiod, self._perc_dict["coupon"], forward_DP_perc, 
+            self._redemption, self._frequency, *args, **kwargs)
         assert forward_yield_perc >= 0 and forward_yield_perc <= 100
         return forward_yield_perc
 
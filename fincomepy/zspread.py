@@ -1,7 +1,7 @@
 import numpy as np
 from scipy.optimize import root
 import matplotlib.pyplot as plt
-from fincomepy.fixedincome import FixedIncome
+from .fixedincome import FixedIncome
 
 class ZspreadZero(FixedIncome):
     '''
@@ -135,8 +135,7 @@ class ZspreadZero(FixedIncome):
     @staticmethod
     def total_CF_zspread(zspread, zero_rates_regular, CF_regular, maturity):
         '''Calculate the total cash flow.'''
-        CF_each_period = CF_regular/ (1 + zero_rates_regular + zspread) ** maturity
-        return np.sum(CF_each_period)
+        return CF_regular @ (1 + zero_rates_regular + zspread) ** -maturity
 
 
 class ZspreadPar(ZspreadZero):
@@ -233,13 +232,13 @@ class ZspreadPar(ZspreadZero):
         0.8071642537725563
         """
         # calculate discount factors
-        discount_factor = []
-        discount_factor.append(self._reg_dict["face_value"] / (self._reg_dict["face_value"] + self._reg_dict["par_rates"][0]))
+        discount_factor = np.empty(self._reg_dict["par_rates"].size, dtype=np.float64)
+        discount_factor[0] = self._reg_dict["face_value"] / (self._reg_dict["face_value"] + self._reg_dict["par_rates"][0])
+        discount_factor_total = discount_factor[0]
         for i in range(1, self._reg_dict["par_rates"].size):
-            df = (self._reg_dict["face_value"] - self._reg_dict["par_rates"][i] * sum(discount_factor)) / \
+            discount_factor[i] = (self._reg_dict["face_value"] - self._reg_dict["par_rates"][i] * discount_factor_total) / \
                  (self._reg_dict["face_value"] + self._reg_dict["par_rates"][i])
-            discount_factor.append(df)
-        discount_factor = np.array(discount_factor)
+            discount_factor_total += discount_factor[i]
         self._discount_factor = discount_factor
         # convert discount factors into discrete or continuous zero coupon rates
         if self._compound == "discrete":
@@ -1,17 +1,62 @@
 """The setup script."""
 
+import importlib.util
+import os
+import setuptools.command.build_ext
 from setuptools import setup, find_packages
 
 with open('README.md') as readme_file:
     readme = readme_file.read()
 
 requirements = ['numpy', 'datetime', 'python-dateutil', 
-    'matplotlib', 'scipy', 'flask', 'pytest', 'pandas']
+    'matplotlib', 'scipy', 'numba', 'flask', 'pytest', 'pandas']
 
 setup_requirements = ['pytest-runner']
 
 test_requirements = ['pytest>=3']
 
+
+def aot_extensions():
+    '''Ahead-of-time compiled Numba kernels, see fincomepy/_kernels.py.'''
+    try:
+        spec = importlib.util.spec_from_file_location('fincomepy._kernels', os.path.join('fincomepy', '_kernels.py'))
+        kernels = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(kernels)
+        compiler = kernels._aot_compiler()
+    except ImportError:
+        # without numba (or numba.pycc) at build time, the kernels are JIT-compiled on first use instead
+        return []
+    except RuntimeError as error:
+        # numba.pycc could not find a C compiler
+        print('skipping the ahead-of-time compiled kernels: {}'.format(error))
+        return []
+    # optional, so a failed build falls back to the JIT kernels as well
+    return [compiler.distutils_extension(optional=True)]
+
+
+def optional_build_ext():
+    '''build_ext command which skips optional extensions that fail to build.'''
+    # looked up at call time, since numba.pycc replaces build_ext with a subclass that compiles 
+    # the kernels before the extension is linked
+    base = setuptools.command.build_ext.build_ext
+
+    class OptionalBuildExt(base):
+        def build_extension(self, ext):
+            try:
+                base.build_extension(self, ext)
+            except Exception as error:
+                # numba.pycc reports a missing compiler as a RuntimeError, which setuptools
+                # does not treat as a build error of an optional extension
+                if not ext.optional:
+                    raise
+                self.warn('building optional extension "{}" failed: {}'.format(ext.name, error))
+
+    return OptionalBuildExt
+
+
+ext_modules = aot_extensions()
+
+
 setup(
     author="Xu Ren",
     author_email='xuren2120@gmail.com',
@@ -28,6 +73,8 @@ setup(
         'Programming Language :: Python :: 3.8',
     ],
     description="Fixed income related calculation in Python",
+    cmdclass={'build_ext': optional_build_ext()},
+    ext_modules=ext_modules,
     install_requires=requirements,
     license="MIT license",
     long_description=readme + '\n\n',
@@ -1,5 +1,6 @@
 import unittest
 from datetime import date, timedelta
+import numpy as np
 from fincomepy import Bond
 
 class Test(unittest.TestCase):
@@ -64,6 +65,52 @@ class Test(unittest.TestCase):
         # bond_test._couppcd
         # bond_test._coupncd
 
+    def test_dirty_price_batch(self):
+        settlement = date(2020,7,15)
+        maturities = [date(2025, 3, 20), date(2025, 3, 31), date(2028, 2, 29), date(2030, 5, 15), date(2050, 8, 15)]
+        coupons = [0.25, 0.25, 0.25, 0.625, 1.375]
+        ylds = [0.2903, 0.2901, 0.2749, 0.6233, 1.4]
+        for frequency in [1, 2]:
+            for basis in range(5):
+                prices = Bond.dirty_price_batch(settlement, maturities, coupons, ylds, 100, frequency, basis)
+                self.assertEqual(prices.shape, (len(maturities),))
+                for maturity, coupon, yld, price in zip(maturities, coupons, ylds, prices):
+                    expected = Bond.dirty_price(settlement, maturity, coupon, yld, 100, frequency, basis)
+                    self.assertAlmostEqual(price, expected, places=8)
+
+    def test_yld_fallback(self):
+        # with a single Newton iteration allowed, the bracketed solve has to take over
+        yld = Bond.yld(settlement=date(2020,7,15), maturity=date(2030,5,15), rate=0.625,
+                    pr=(100+0.5/32), redemption=105, frequency=2, basis=1, maxiter=1)
+        self.assertAlmostEqual(yld, 1.1060, places=4)
+        yld = Bond.yld(settlement=date(2020,7,15), maturity=date(2030,5,15), rate=0.625,
+                    pr=(100+0.5/32), redemption=105, frequency=2, basis=1, maxiter=1, disp=False)
+        self.assertAlmostEqual(yld, 1.1060, places=4)
+        yld = Bond.yld(settlement=date(2020,7,15), maturity=date(2050,5,15), rate=0.0,
+                    pr=30, redemption=100, frequency=2, basis=1, maxiter=1)
+        expected = Bond.yld(settlement=date(2020,7,15), maturity=date(2050,5,15), rate=0.0,
+                    pr=30, redemption=100, frequency=2, basis=1)
+        self.assertAlmostEqual(yld, expected, places=8)
+        # Newton overshoots below -100% from the coupon rate, where the price is undefined
+        yld = Bond.yld(settlement=date(2012,7,26), maturity=date(2041,9,15), rate=15.0,
+                    pr=888.5207306010916, redemption=100, frequency=1, basis=0)
+        self.assertAlmostEqual(yld, -2.6386, places=4)
+        bond_test = Bond(settlement=date(2012,7,26), maturity=date(2041,9,15), coupon_perc=15.0, 
+                 price_perc=888.5207306010916, frequency=1, basis=0)
+        bond_test.mac_duration()
+        self.assertAlmostEqual(bond_test._yld, -2.6386, places=4)
+
+    def test_cached_yld(self):
+        bond_test = Bond(settlement=date(2020,7,15), maturity=date(2025,6,30), coupon_perc=0.25, 
+                 price_perc=(99+26/32), frequency=2, basis=1)
+        self.assertTrue(bond_test._yld is None)
+        self.assertAlmostEqual(bond_test.mod_duration(), 4.9241, places=4)
+        self.assertAlmostEqual(bond_test._yld, 0.2881, places=4)
+        bond_test = Bond(settlement=date(2020,7,15), maturity=date(2025,6,30), coupon_perc=0.25, 
+                 price_perc=(99+26/32), frequency=2, basis=1, yld=0.0)
+        bond_test.convexity()
+        self.assertEqual(bond_test._yld, 0.0)
+
     def test_couppcd(self):
         pcd = Bond.couppcd(settlement=date(2020,7,15), maturity=date(2030,5,15), frequency=2, basis=1)
         self.assertEqual(pcd, date(2020, 5, 15))
@@ -136,6 +183,42 @@ class Test(unittest.TestCase):
             coupon_dts = bond_obj.coupon_dates()
             self.assertEqual(bond["ncd"], coupon_dts[-1])
 
+    def test_yld_batch(self):
+        settlement = date(2020,7,15)
+        maturities = [date(2025, 3, 20), date(2025, 3, 31), date(2025, 6, 30), date(2028, 2, 29), date(2030, 5, 15)]
+        coupons = [0.25, 0.25, 0.25, 0.25, 0.625]
+        prices = [99.8125, 99.8125, 99.8125, 99.8125, (100+0.5/32)]
+        for basis in range(5):
+            ylds = Bond.yld_batch(settlement, maturities, coupons, prices, 100, frequency=2, basis=basis)
+            self.assertEqual(ylds.shape, (len(maturities),))
+            for maturity, coupon, price, yld in zip(maturities, coupons, prices, ylds):
+                expected = Bond.yld(settlement, maturity, coupon, price, 100, frequency=2, basis=basis)
+                self.assertAlmostEqual(yld, expected, places=8)
+        ylds = Bond.yld_batch(settlement, date(2030,5,15), 0.625, (100+0.5/32), [100, 105], frequency=2, basis=1)
+        self.assertAlmostEqual(ylds[0], 0.6233, places=4)
+        self.assertAlmostEqual(ylds[1], 1.1060, places=4)
+
+    def test_yld_batch_fallback(self):
+        # with a single Newton iteration allowed, the bisection has to take over
+        settlement = date(2020,7,15)
+        maturities = [date(2030,5,15), date(2050,5,15), date(2050,5,15)]
+        coupons = [0.625, 0.0, 0.0]
+        prices = [(100+0.5/32), 30, 1e12]
+        redemptions = [105, 100, 100]
+        ylds = Bond.yld_batch(settlement, maturities, coupons, prices, redemptions, frequency=2, basis=1, maxiter=1)
+        self.assertAlmostEqual(ylds[0], 1.1060, places=4)
+        expected = Bond.yld(settlement, date(2050,5,15), 0.0, 30, 100, frequency=2, basis=1)
+        self.assertAlmostEqual(ylds[1], expected, places=8)
+        # the yield of the last bond lies below the bisection bracket
+        self.assertTrue(np.isnan(ylds[2]))
+        # Newton overshoots below -100% for the first bond, which must not affect the second
+        settlement = date(2012,7,26)
+        ylds = Bond.yld_batch([settlement, settlement], [date(2041,9,15), date(2030,5,15)], [15.0, 0.625], 
+                              [888.5207306010916, 100.015625], 100, frequency=1, basis=0)
+        self.assertAlmostEqual(ylds[0], -2.6386, places=4)
+        expected = Bond.yld(settlement, date(2030,5,15), 0.625, 100.015625, 100, frequency=1, basis=0)
+        self.assertAlmostEqual(ylds[1], expected, places=8)
+
     def test_parse_price(self):
         bond_test1 = Bond(settlement=date(2020,7,15), maturity=date(2030,5,15), coupon_perc=0.625, 
                  price_perc=(100+0.5/32), frequency=2, basis=1)
@@ -153,6 +236,31 @@ class Test(unittest.TestCase):
                  price_perc="99-26", frequency=2, basis=1)
         self.assertEqual(bond_test1._perc_dict["clean_price"], bond_test2._perc_dict["clean_price"])
 
+    def test_float_frequency(self):
+        bond_test = Bond(settlement=date(2020,7,15), maturity=date(2030,5,15), coupon_perc=0.625, 
+                 price_perc=(100+0.5/32), frequency=2.0, basis=1)
+        self.assertEqual(bond_test._coupon_interval, 6)
+        self.assertEqual(bond_test._couppcd, date(2020, 5, 15))
+        self.assertAlmostEqual(bond_test.mac_duration(), 9.5437, places=3)
+        self.assertEqual(Bond.couppcd(settlement=date(2020,7,15), maturity=date(2030,5,15), frequency=2.0, basis=1), 
+                         date(2020, 5, 15))
+        self.assertEqual(Bond.coupncd(settlement=date(2020,7,15), maturity=date(2030,5,15), frequency=2.0, basis=1), 
+                         date(2020, 11, 15))
+        dirty_price = Bond.dirty_price(settlement=date(2020,7,15), maturity=date(2030,5,15),
+                      rate=0.625, yld=0.62334818, redemption=100, frequency=2.0, basis=1)
+        self.assertAlmostEqual(dirty_price, 100.1192, places=4)
+        yld = Bond.yld(settlement=date(2020,7,15), maturity=date(2030,5,15), rate=0.625,
+                    pr=(100+0.5/32), redemption=100, frequency=2.0, basis=1)
+        self.assertAlmostEqual(yld, 0.6233, places=4)
+        ylds = Bond.yld_batch(date(2020,7,15), date(2030,5,15), 0.625, (100+0.5/32), 100, frequency=2.0, basis=1)
+        self.assertAlmostEqual(ylds[()], 0.6233, places=4)
+        with self.assertRaises(ValueError):
+            Bond(settlement=date(2020,7,15), maturity=date(2030,5,15), coupon_perc=0.625, 
+                 price_perc=(100+0.5/32), frequency=5, basis=1)
+        with self.assertRaises(ValueError):
+            Bond.yld(settlement=date(2020,7,15), maturity=date(2030,5,15), rate=0.625,
+                    pr=(100+0.5/32), redemption=100, frequency=1.5, basis=1)
+
     def test_invalid_input(self):
         with self.assertRaises(Exception):
             Bond.accrint(issue=date(2020, 11, 15), first_interest=date(2020, 5, 15), 
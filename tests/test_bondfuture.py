@@ -1,4 +1,5 @@
 import unittest
+import numpy as np
 from datetime import date, timedelta
 from fincomepy import BondFuture
 
@@ -35,6 +36,43 @@ class Test(unittest.TestCase):
         self.assertAlmostEqual(bf_test.net_basis()/32, 0.792, places=2)
         self.assertAlmostEqual(bf_test.implied_repo_rate(), -1.388, places=2)
 
+    def test_full_future_val_convention(self):
+        # no coupon falls inside the repo window, so only the accrued interest at the repo end date 
+        # is added to the invoice price, using the bond's own frequency and day count convention
+        bf_test = BondFuture(settlement=date(2020,7,17), maturity=date(2027,5,15), coupon_perc=2.375, 
+            price_perc=113.015625, frequency=1, basis=1, 
+            repo_period=75, repo_rate_perc=0.14, futures_pr_perc=139.4375, conversion_factor=0.8072)
+        self.assertEqual(bf_test._coupncd, date(2021,5,15))
+        self.assertAlmostEqual(bf_test.full_future_val(), 112.55395 + 2.375 * 138 / 365, places=8)
+        bf_test = BondFuture(settlement=date(2020,7,17), maturity=date(2027,5,15), coupon_perc=2.375, 
+            price_perc=113.015625, frequency=1, basis=2, 
+            repo_period=75, repo_rate_perc=0.14, futures_pr_perc=139.4375, conversion_factor=0.8072)
+        self.assertAlmostEqual(bf_test.full_future_val(), 112.55395 + 2.375 * 138 / 360, places=8)
+
+    def test_batch(self):
+        bf_tests = [
+            BondFuture(settlement=date(2014,1,29), maturity=date(2025,3,7), coupon_perc=5.00, 
+                price_perc=119.795, frequency=2, basis=1, 
+                repo_period=152, repo_rate_perc=0.588, futures_pr_perc=108.44, 
+                conversion_factor=1.086725, type='UK'),
+            BondFuture(settlement=date(2014,1,29), maturity=date(2023,9,7), coupon_perc=2.25, 
+                price_perc=95.355, frequency=2, basis=1, 
+                repo_period=152, repo_rate_perc=0.588, futures_pr_perc=108.44, 
+                conversion_factor=0.8655782, type='UK')
+        ]
+        dirty_price = np.array([bf._perc_dict["dirty_price"] for bf in bf_tests])
+        future_val = np.array([bf.full_future_val() for bf in bf_tests])
+        forward_pr = BondFuture.forward_price_batch(dirty_price, 0.588, 152, type='UK')
+        net_basis = BondFuture.net_basis_batch(dirty_price, 0.588, 152, future_val, type='UK')
+        implied_repo = BondFuture.implied_repo_rate_batch(dirty_price, future_val, 152, type='UK')
+        self.assertEqual(forward_pr.shape, (2,))
+        self.assertAlmostEqual(forward_pr[0], 122.082, places=2)
+        self.assertAlmostEqual(forward_pr[1], 96.486, places=2)
+        self.assertAlmostEqual(net_basis[0]/32, 0.171, places=2)
+        self.assertAlmostEqual(net_basis[1]/32, 0.792, places=2)
+        self.assertAlmostEqual(implied_repo[0], 0.252, places=2)
+        self.assertAlmostEqual(implied_repo[1], -1.388, places=2)
+
 if __name__ == '__main__':
     unittest.main()
 